@@ -1,11 +1,21 @@
-import requests
+import httpx
 from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+from lxml import etree, html as lxml_html
 import pandas as pd
+import xlsxwriter
 import time
+import asyncio
 import random
 import re
-from io import BytesIO
-from urllib.parse import quote_plus, urlparse
+import diskcache
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+import csv
+from io import BytesIO, TextIOWrapper
+from collections import deque
+from urllib.parse import quote_plus, urlparse, urlsplit
 from datetime import datetime, timedelta, timezone
 
 try:
@@ -13,6 +23,11 @@ try:
 except ImportError:  # pragma: no cover - streamlit이 없는 환경 대비
     st = None
 
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - xxhash가 없는 환경 대비
+    xxhash = None
+
 # =========================
 # 기본 설정
 # =========================
@@ -44,26 +59,97 @@ headers = {
     ),
     "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
     "Referer": "https://www.naver.com/",
+    "Accept-Encoding": "gzip, br",
 }
 
+# 검색 결과 페이지 동시 요청 설정
+CONCURRENCY = 4        # 동시에 진행 중인 요청 수 상한
+PREFETCH_WINDOW = 8    # 한 번에 미리 요청하는 페이지(start 오프셋) 수
+
+# 예의 있는 대기(적응형): 응답이 빠르면 줄이고, 느리거나 429/503 이면 늘림
+FAST_RESPONSE_SEC = 0.5
+SLOW_RESPONSE_SEC = 2.0
+MAX_POLITE_DELAY = 30.0        # 대기/백오프 상한(초)
+RETRY_STATUS = (429, 503)
+MAX_RETRIES = 3
+
+# 결과 카드가 있는 페이지에만 나타나는 마크업 (없으면 파싱 없이 마지막 페이지로 판단)
+RESULT_FINGERPRINTS = (
+    b"list_news",
+    b"news_area",
+    b"sds-comps-base-layout",
+    b"sds-comps-vertical-layout",
+)
+
 # 세션 + 가벼운 재시도
-session = requests.Session()
-adapter = requests.adapters.HTTPAdapter(max_retries=2)
-session.mount("http://", adapter)
-session.mount("https://", adapter)
+# (HTTP/2 keep-alive 로 기사 원문 조회 시 연결/핸드셰이크 재사용)
+session = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=8),
+    ),
+    headers=headers,
+    timeout=10.0,
+    follow_redirects=True,
+)
+
+# 응답 디스크 캐시 (URL 키) - 같은 조건으로 다시 실행할 때 네트워크 요청을 생략
+# (실행 위치와 상관없이 app.py 옆에 두고, import 시점이 아니라 처음 쓸 때 생성)
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".naver_cache")
+CACHE_EXPIRE = timedelta(hours=6).total_seconds()
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+def get_response_cache() -> diskcache.Cache:
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = diskcache.Cache(CACHE_DIR)
+        return _response_cache
+
+# 기사 원문 날짜 조회 (최후의 보루) 설정
+ARTICLE_WORKERS = 8            # 동시에 조회할 기사 수
+ARTICLE_HEAD_BYTES = 64 * 1024 # 메타 태그는 <head> 에 있으므로 앞부분만 읽음
+
+# 검색 결과 파싱 설정 (다운로드와 겹쳐서 진행)
+PARSE_WORKERS = 2      # 파싱 스레드 수
+PARSE_QUEUE_SIZE = 2   # 파서보다 앞서 받아 둘 수 있는 페이지 수
 
 # 날짜/상대시간 패턴
 DATE_PAT = re.compile(r'20\d{2}\.\d{1,2}\.\d{1,2}')
 REL_PAT  = re.compile(r'(\d+)\s*(분|시간|일)\s*전')
+REL_UNIT = {"분": "minutes", "시간": "hours", "일": "days"}
+REL_UNIT_DELTA = {k: pd.Timedelta(**{v: 1}) for k, v in REL_UNIT.items()}
+# 파싱 단계에서는 상대시간을 계산하지 않고 원문에 이 접두어를 붙여 두었다가 build_dataframe 에서 일괄 변환
+REL_PREFIX = "REL:"
+
+# 기사 원문 날짜: <time datetime> / article:published_time / 본문 날짜를 한 번에 탐색
+META_DATE_RE = re.compile(
+    rb'<time[^>]*datetime=["\']([^"\']+)'
+    rb'|article:published_time["\'][^>]*content=["\']([^"\']+)'
+    rb'|(20\d{2})[.\-/](\d{1,2})[.\-/](\d{1,2})',
+    re.I,
+)
 
 # headline 전용 선택자 (제목 뽑기용)
+# (쉼표 목록이면 Lexbor 가 매칭된 항목마다 같은 노드를 중복 반환하므로 :is() 로 묶음;
+#  ellipsis-1/2 변형도 headline1/2 클래스를 함께 갖기 때문에 그대로 포함됨)
 HEADLINE_SEL = (
-    "span.sds-comps-text.sds-comps-text-ellipsis-1.sds-comps-text-type-headline1, "
-    "span.sds-comps-text.sds-comps-text-ellipsis-2.sds-comps-text-type-headline1, "
-    "span.sds-comps-text.sds-comps-text-type-headline1, "
-    "span.sds-comps-text.sds-comps-text-type-headline2"
+    "span.sds-comps-text:is(.sds-comps-text-type-headline1, .sds-comps-text-type-headline2)"
 )
 
+# headline span 판별용 (bs4 폴백에서 :has() 대신 직접 비교)
+HEADLINE_TAGS = "span"
+HEADLINE_TYPE_CLASSES = frozenset({
+    "sds-comps-text-type-headline1",
+    "sds-comps-text-type-headline2",
+})
+
+# bs4 폴백용 클래스 정규식 (카드마다 새로 컴파일하지 않도록 미리 준비)
+NEWS_TIT_RE = re.compile("news_tit")
+PRESS_CLASS_RE = re.compile(r"(press|source|profile-info-title)", re.I)
+
 # 언론사 전용 선택자
 PRESS_SEL = (
     # 스크린샷 구조: 프로필(언론사) 타이틀 영역
@@ -73,6 +159,57 @@ PRESS_SEL = (
     "span.sds-comps-text.sds-comps-text-type-body2"
 )
 
+# 카드/링크/날짜 선택자 (카드마다 문자열을 새로 만들지 않도록 미리 준비)
+CARD_SEL = "ul.list_news > li.bx"
+CARD_FALLBACK_SEL = "div:is(.news_area, .sds-comps-base-layout, .sds-comps-vertical-layout)"
+HEADLINE_ANCHOR_SEL = f"a:has(> {HEADLINE_SEL})"
+NEWS_TIT_SEL = 'a[class*="news_tit"]'
+INFO_GROUP_SEL = "div.info_group > span.info"
+INFO_ITEMS_SEL = "div.info_group > .info"
+SDS_DATE_SEL = "span.sds-comps-text.sds-comps-text-type-body2.sds-comps-text-weight-sm"
+
+# lxml XPath 폴백용 (Lexbor가 카드를 못 찾았을 때 bs4 보다 먼저 시도)
+def _xp_cls(*names: str) -> str:
+    """class 속성에 주어진 토큰이 모두 있는지 검사하는 XPath 조건식"""
+    return " and ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {n} ')" for n in names
+    )
+
+_XP_HEADLINE_PRED = (
+    f"{_xp_cls('sds-comps-text')} and "
+    f"({_xp_cls('sds-comps-text-type-headline1')} or {_xp_cls('sds-comps-text-type-headline2')})"
+)
+LXML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+XP_CARD = etree.XPath(f"//ul[{_xp_cls('list_news')}]/li[{_xp_cls('bx')}]")
+XP_CARD_FALLBACK = etree.XPath(
+    f"//div[{_xp_cls('news_area')} or {_xp_cls('sds-comps-base-layout')}"
+    f" or {_xp_cls('sds-comps-vertical-layout')}]"
+)
+XP_HEADLINE = etree.XPath(f"(.//span[{_XP_HEADLINE_PRED}])[1]")
+XP_HEADLINE_ANCHOR = etree.XPath(f"(.//a[span[{_XP_HEADLINE_PRED}]])[1]")
+XP_NEWS_TIT = etree.XPath("(.//a[contains(@class, 'news_tit')])[1]")
+XP_ANCHORS = etree.XPath(".//a")
+XP_PRESS = etree.XPath(
+    f"(.//div[{_xp_cls('sds-comps-profile-info-title')}]"
+    f"//span[{_xp_cls('sds-comps-text', 'sds-comps-text-type-body2', 'sds-comps-profile-info-title-text')}]"
+    f" | .//div[{_xp_cls('sds-comps-profile-info-title')}]"
+    f"//a/span[{_xp_cls('sds-comps-text', 'sds-comps-text-type-body2')}])[1]"
+)
+XP_INFO_PRESS = etree.XPath(
+    f"(.//a[{_xp_cls('info', 'press')}] | .//div[{_xp_cls('info_group')}]/a[{_xp_cls('info')}])"
+)
+# 기존 정규식(re.I)/Lexbor([class*=... i])와 같게 대소문자 무시
+_XP_LOWER_CLASS = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+XP_PRESS_CLASS = etree.XPath(
+    f"(.//*[contains({_XP_LOWER_CLASS}, 'press') or contains({_XP_LOWER_CLASS}, 'source')"
+    f" or contains({_XP_LOWER_CLASS}, 'profile-info-title')])[1]"
+)
+XP_INFO_GROUP = etree.XPath(f".//div[{_xp_cls('info_group')}]/span[{_xp_cls('info')}]")
+XP_SDS_DATE = etree.XPath(
+    f".//span[{_xp_cls('sds-comps-text', 'sds-comps-text-type-body2', 'sds-comps-text-weight-sm')}]"
+)
+XP_TIME = etree.XPath("(.//time)[1]")
+
 def build_url(encoded_query: str, sort_value: int, start_date: str, end_date: str, nso_period: str, start: int) -> str:
     """네이버 뉴스 검색 URL 생성(where=news 레이아웃)"""
     return (
@@ -85,27 +222,18 @@ def build_url(encoded_query: str, sort_value: int, start_date: str, end_date: st
         f"&start={start}"
     )
 
-def _normalize_relative_date(text: str) -> str:
+def _vec_normalize(texts: pd.Series) -> pd.Series:
     """
-    '3시간 전', '2일 전', '45분 전', '어제', '오늘' → 'YYYY.MM.DD' (KST 기준)
+    '3시간 전', '2일 전', '45분 전', '어제', '오늘' → 날짜 (KST 기준, 시리즈 단위로 한 번에 계산)
+    해석할 수 없는 값은 NaT.
     """
-    t = text.strip()
-    now = datetime.now(KST)
-    m = REL_PAT.search(t)
-    if m:
-        n, unit = int(m.group(1)), m.group(2)
-        if unit == "분":
-            dt = now - timedelta(minutes=n)
-        elif unit == "시간":
-            dt = now - timedelta(hours=n)
-        else:
-            dt = now - timedelta(days=n)
-        return dt.strftime("%Y.%m.%d")
-    if "어제" in t:
-        return (now - timedelta(days=1)).strftime("%Y.%m.%d")
-    if "오늘" in t:
-        return now.strftime("%Y.%m.%d")
-    return ""
+    now = pd.Timestamp(datetime.now(KST).replace(tzinfo=None))
+    ext = texts.str.extract(REL_PAT)
+    delta = pd.to_timedelta(ext[1].map(REL_UNIT_DELTA)) * pd.to_numeric(ext[0])
+    missing = delta.isna()
+    delta = delta.mask(missing & texts.str.contains("어제"), pd.Timedelta(days=1))
+    delta = delta.mask(missing & texts.str.contains("오늘"), pd.Timedelta(0))
+    return (now - delta).dt.normalize()
 
 def _extract_date_from_url(url: str) -> str:
     """URL 경로에 /2025/07/01/ 또는 /20250701/ 같은 날짜가 박힌 경우 추출"""
@@ -126,39 +254,85 @@ def _extract_date_from_url(url: str) -> str:
         pass
     return ""
 
+def fetch(url: str, timeout: float = 10, max_bytes: int | None = None) -> bytes:
+    """
+    캐시를 거쳐 URL 본문(bytes)을 가져옴. 200이 아니면 빈 bytes.
+    max_bytes 를 주면 스트리밍으로 앞부분만 읽음 (메타 태그가 있는 <head> 용).
+    """
+    body = get_response_cache().get(url)
+    if body is not None:
+        return body
+    if max_bytes is None:
+        r = session.get(url, timeout=timeout)
+        if r.status_code != 200:
+            return b""
+        body = r.content
+    else:
+        with session.stream("GET", url, timeout=timeout) as r:
+            if r.status_code != 200:
+                return b""
+            chunks, size = [], 0
+            for chunk in r.iter_bytes():
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= max_bytes:
+                    break
+            body = b"".join(chunks)[:max_bytes]
+    get_response_cache().set(url, body, expire=CACHE_EXPIRE)
+    return body
+
+def _iso_to_date(iso: str) -> str:
+    try:
+        dt = datetime.fromisoformat(iso.replace("Z", "+00:00"))
+        return dt.astimezone(KST).strftime("%Y.%m.%d")
+    except:
+        return ""
+
+def _scan_meta_dates(buf: bytes) -> tuple[str, str]:
+    """
+    META_DATE_RE 한 번의 탐색으로 (구조화 날짜, 일반 날짜) 추출.
+    구조화 날짜: 처음으로 해석 가능한 <time datetime> / article:published_time 값
+    (비표준 형식이면 값 안의 숫자 날짜, 'PT5M' 처럼 날짜가 없으면 다음 후보로 넘어감)
+    일반 날짜: 처음 나온 본문/URL 속 'YYYY.MM.DD' 류 날짜 (구조화 날짜가 없을 때의 대안)
+    """
+    loose = bare = ""
+    for m in META_DATE_RE.finditer(buf):
+        iso = m.group(1) or m.group(2)
+        if iso is None:
+            if not bare:
+                bare = _ymd_from_match(m)
+            continue
+        date_text = _iso_to_date(iso.decode("ascii", errors="ignore"))
+        if date_text:
+            return date_text, bare
+        if not loose:
+            inner = META_DATE_RE.search(iso)
+            if inner and inner.group(3):
+                loose = _ymd_from_match(inner)
+    return loose, bare
+
+def _ymd_from_match(m) -> str:
+    y, mo, d = m.group(3, 4, 5)
+    return f"{y.decode()}.{int(mo):02d}.{int(d):02d}"
+
 def _extract_date_from_article(url: str) -> str:
     """
     최후의 보루: 기사 원문 페이지에서 <time datetime>, og:article:published_time 등으로 추출
     (느려지므로 정말 필요할 때만 호출)
     """
     try:
-        r = session.get(url, headers=headers, timeout=8)
-        if r.status_code != 200:
+        html = fetch(url, timeout=8, max_bytes=ARTICLE_HEAD_BYTES)
+        if not html:
             return ""
-        html = r.text
-        m = re.search(r'<time[^>]*datetime=["\']([^"\']+)["\']', html, flags=re.I)
-        if m:
-            iso = m.group(1)
-            try:
-                dt = datetime.fromisoformat(iso.replace("Z", "+00:00"))
-                return dt.astimezone(KST).strftime("%Y.%m.%d")
-            except:
-                pass
-        m = re.search(
-            r'property=["\']article:published_time["\'][^>]*content=["\']([^"\']+)["\']',
-            html, flags=re.I
-        )
-        if m:
-            iso = m.group(1)
-            try:
-                dt = datetime.fromisoformat(iso.replace("Z", "+00:00"))
-                return dt.astimezone(KST).strftime("%Y.%m.%d")
-            except:
-                pass
-        m = re.search(r'(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})', html)
-        if m:
-            y, mo, d = m.groups()
-            return f"{y}.{int(mo):02d}.{int(d):02d}"
+        # 메타 태그가 모여 있는 <head> 만 먼저 훑고, 없을 때만 나머지 본문을 이어서 탐색
+        end = html.find(b"</head>")
+        head_len = end + 7 if end != -1 else 32 * 1024
+        structured, bare = _scan_meta_dates(html[:head_len])
+        if structured:
+            return structured
+        # 우선순위: 구조화 날짜(본문 포함) → <head> 속 일반 날짜 → 본문 속 일반 날짜
+        body_structured, body_bare = _scan_meta_dates(html[head_len:])
+        return body_structured or bare or body_bare
     except:
         pass
     return ""
@@ -166,37 +340,126 @@ def _extract_date_from_article(url: str) -> str:
 def _clean_text(s: str) -> str:
     return " ".join(s.replace("\n", " ").replace("\r", " ").split())
 
+def _date_from_texts(texts) -> str:
+    """
+    텍스트 후보들에서 'YYYY.MM.DD' 를 찾아 반환.
+    상대시간('3시간 전', '어제' 등)은 'REL:<원문>' 으로 남겨 build_dataframe 에서 변환.
+    """
+    for raw in texts:
+        t = _clean_text(raw)
+        m = DATE_PAT.search(t)
+        if m:
+            return m.group()
+        if REL_PAT.search(t) or "어제" in t or "오늘" in t:
+            return REL_PREFIX + t
+    return ""
+
+def _date_from_time_tag(dt_attr, text: str) -> str:
+    """<time datetime="..."> 속성 우선, 실패 시 태그 텍스트로 날짜 추출"""
+    if dt_attr:
+        date_text = _iso_to_date(dt_attr)
+        if date_text:
+            return date_text
+    return _date_from_texts([text])
+
 def _extract_title_from_card(box) -> str:
     """
-    sds 뉴스 카드 구조에서 제목 전용 span(headline1/2)을 우선 추출.
-    mark 태그가 섞여 있어도 get_text(' ', strip=True)로 자연스럽게 합쳐짐.
+    sds 뉴스 카드(Lexbor 노드)에서 제목 전용 span(headline1/2)을 우선 추출.
+    mark 태그가 섞여 있어도 text(separator=' ')로 자연스럽게 합쳐짐.
     """
+    # 1) headline 전용 span (headline span을 자식으로 가진 a 포함)
+    span = box.css_first(HEADLINE_SEL)
+    if span:
+        return _clean_text(span.text(deep=True, separator=" ", strip=True))
+
+    # 2) 공용 구조(뉴스 타이틀)
+    a = box.css_first(NEWS_TIT_SEL)
+    if a:
+        return _clean_text(a.text(deep=True, separator=" ", strip=True))
+
+    # 3) 보조: 키워드 포함 긴 a 텍스트
+    for x in box.css("a"):
+        txt = _clean_text(x.text(deep=True, separator=" ", strip=True))
+        if "여의시스템" in txt and len(txt) > 10:
+            return txt
+    return ""
+
+def _source_from_domain(link: str) -> str:
+    """최후의 보루: 링크 도메인에서 언론사명 추정"""
+    if link:
+        try:
+            domain = urlparse(link).netloc.replace("www.", "")
+            if domain:
+                return domain.split(".")[0]
+        except:
+            pass
+    return ""
+
+def _extract_source_from_card(box, link: str = "") -> str:
+    """카드 DOM(Lexbor 노드)에서 언론사명을 최대한 안정적으로 추출."""
+    # 1) 신규/sds 구조 우선
+    sp = box.css_first(PRESS_SEL)
+    if sp:
+        src = _clean_text(sp.text(strip=True))
+        if src:
+            return src
+
+    # 2) 공용/구형 네이버 구조
+    a_press = box.css_first("a.info.press") or box.css_first("div.info_group > a.info")
+    if a_press:
+        src = _clean_text(a_press.text(strip=True))
+        if src:
+            return src
+
+    # 3) 클래스 키워드 기반 보조
+    cand = box.css_first(
+        '[class*="press" i], [class*="source" i], [class*="profile-info-title" i]'
+    )
+    if cand:
+        src = _clean_text(cand.text(strip=True))
+        if src and len(src) <= 30:
+            return src
+
+    # 4) 최후의 보루: 도메인
+    return _source_from_domain(link)
+
+def _extract_title_from_card_bs4(box) -> str:
+    """_extract_title_from_card 의 BeautifulSoup 버전 (Lexbor 실패 시 폴백)"""
     # 1) headline 전용 span
     span = box.select_one(HEADLINE_SEL)
     if span:
         return _clean_text(span.get_text(" ", strip=True))
 
-    # 2) headline span을 자식으로 가진 a
-    a = box.select_one(f"a:has(> {HEADLINE_SEL})")
-    if a:
-        sp = a.select_one(HEADLINE_SEL)
-        if sp:
-            return _clean_text(sp.get_text(" ", strip=True))
-
-    # 3) 공용 구조(뉴스 타이틀)
-    a = box.select_one("a.news_tit") or box.find("a", attrs={"class": re.compile("news_tit")})
+    # 2) 공용 구조(뉴스 타이틀)
+    a = box.find("a", attrs={"class": NEWS_TIT_RE})
     if a:
         return _clean_text(a.get_text(" ", strip=True))
 
-    # 4) 보조: 키워드 포함 긴 a 텍스트
+    # 3) 보조: 키워드 포함 긴 a 텍스트
     for x in box.find_all("a"):
         txt = _clean_text(x.get_text(" ", strip=True))
         if "여의시스템" in txt and len(txt) > 10:
             return txt
     return ""
 
-def _extract_source_from_card(box, link: str = "") -> str:
-    """카드 DOM에서 언론사명을 최대한 안정적으로 추출."""
+def _is_headline_tag_bs4(tag) -> bool:
+    if tag.name != HEADLINE_TAGS:
+        return False
+    classes = tag.get("class") or ()
+    return "sds-comps-text" in classes and not HEADLINE_TYPE_CLASSES.isdisjoint(classes)
+
+def _find_headline_anchor_bs4(box):
+    """headline span을 직계 자식으로 가진 a 탐색 (Soup Sieve의 a:has(> ...) 대체)"""
+    for a in box.find_all("a", limit=8):
+        if a.find(_is_headline_tag_bs4, recursive=False):
+            return a
+    return None
+
+def _extract_source_from_card_bs4(box, link: str = "", infos=()) -> str:
+    """
+    _extract_source_from_card 의 BeautifulSoup 버전 (Lexbor 실패 시 폴백)
+    infos: 호출 측에서 한 번만 조회한 div.info_group > .info 목록
+    """
     # 1) 신규/sds 구조 우선
     sp = box.select_one(PRESS_SEL)
     if sp:
@@ -205,45 +468,47 @@ def _extract_source_from_card(box, link: str = "") -> str:
             return src
 
     # 2) 공용/구형 네이버 구조
-    a_press = box.select_one("a.info.press") or box.select_one("div.info_group > a.info")
+    info_links = [n for n in infos if n.name == "a"]
+    a_press = next((n for n in info_links if "press" in n.get("class", ())), None)
+    if a_press is None and info_links:
+        a_press = info_links[0]
     if a_press:
         src = _clean_text(a_press.get_text(strip=True))
         if src:
             return src
 
     # 3) 클래스 키워드 기반 보조
-    cand = box.find(class_=re.compile(r"(press|source|profile-info-title)", re.I))
+    cand = box.find(class_=PRESS_CLASS_RE)
     if cand:
         src = _clean_text(cand.get_text(strip=True))
         if src and len(src) <= 30:
             return src
 
     # 4) 최후의 보루: 도메인
-    if link:
-        try:
-            domain = urlparse(link).netloc.replace("www.", "")
-            if domain:
-                return domain.split(".")[0]
-        except:
-            pass
-    return ""
+    return _source_from_domain(link)
 
-def parse_page(html: str):
+def parse_page(html: bytes | str):
     """
     우선순위:
     1) 안정 구조: ul.list_news > li.bx 안의 a.news_tit, div.info_group > span.info
     2) 보조 구조: sds-comps-...(headline/date/press)
-    3) 최후의 보루: 기사 원문에서 date 메타 추출
+    날짜를 끝내 찾지 못한 행은 Date="" 로 남기고, 기사 원문 조회는
+    crawl 에서 fill_missing_dates 로 한꺼번에 처리합니다.
+
+    파싱은 selectolax(Lexbor)로 수행하고, 카드를 하나도 찾지 못한 경우에만
+    lxml XPath → BeautifulSoup 순으로 한 번 더 시도합니다.
     """
-    soup = BeautifulSoup(html, "lxml")  # lxml 권장
+    tree = LexborHTMLParser(html)
 
-    rows = []
     # 1) 가장 안정적인 구조
-    boxes = soup.select("ul.list_news > li.bx")
+    boxes = tree.css(CARD_SEL)
     # 2) 없다면 sds 계열 보조
     if not boxes:
-        boxes = soup.select("div.news_area, div.sds-comps-base-layout, div.sds-comps-vertical-layout")
+        boxes = tree.css(CARD_FALLBACK_SEL)
+    if not boxes:
+        return parse_page_lxml(html) or _parse_page_bs4(html)
 
+    rows = []
     for box in boxes:
         # 제목 (headline 우선)
         title = _extract_title_from_card(box)
@@ -251,14 +516,14 @@ def parse_page(html: str):
             continue
 
         # 링크: headline span을 자식으로 가진 a → 공용 a.news_tit → 첫 a
-        a = box.select_one(f"a:has(> {HEADLINE_SEL})")
-        if not a:
-            a = box.select_one("a.news_tit") or box.find("a", attrs={"class": re.compile("news_tit")})
-        if not a:
-            a = box.find("a")
+        a = (
+            box.css_first(HEADLINE_ANCHOR_SEL)
+            or box.css_first(NEWS_TIT_SEL)
+            or box.css_first("a")
+        )
         if not a:
             continue
-        link = a.get("href", "").strip()
+        link = (a.attributes.get("href") or "").strip()
         if not link:
             continue
 
@@ -266,61 +531,210 @@ def parse_page(html: str):
         source = _extract_source_from_card(box, link)
 
         # 날짜
-        date_text = ""
+        # (a) 안정 구조: info_group > span.info
+        date_text = _date_from_texts(
+            sp.text(strip=True) for sp in box.css(INFO_GROUP_SEL)
+        )
+
+        # (b) sds 세 클래스 AND 매칭
+        if not date_text:
+            date_text = _date_from_texts(
+                sp.text(strip=True)
+                for sp in box.css(SDS_DATE_SEL)
+            )
+
+        # (c) time 태그
+        if not date_text:
+            ttag = box.css_first("time")
+            if ttag:
+                date_text = _date_from_time_tag(ttag.attributes.get("datetime"), ttag.text(strip=True))
+
+        # (d) URL 기반 추출 (기사 원문 조회는 crawl 에서 일괄 처리)
+        if not date_text:
+            date_text = _extract_date_from_url(link)
+
+        rows.append({
+            "Title":  title,
+            "Date":   date_text,
+            "Source": source,
+            "Link":   link
+        })
+
+    return rows
+
+def _lxml_text(el, sep: str = "") -> str:
+    """bs4 get_text(sep, strip=True) 와 같은 방식으로 텍스트 조각을 다듬어 이어 붙임"""
+    return sep.join(t.strip() for t in el.itertext() if t.strip())
+
+def _first(nodes):
+    return nodes[0] if nodes else None
+
+def _extract_title_from_card_lxml(box) -> str:
+    """_extract_title_from_card 의 lxml XPath 버전"""
+    # 1) headline 전용 span
+    span = _first(XP_HEADLINE(box))
+    if span is not None:
+        return _clean_text(_lxml_text(span, " "))
+
+    # 2) 공용 구조(뉴스 타이틀)
+    a = _first(XP_NEWS_TIT(box))
+    if a is not None:
+        return _clean_text(_lxml_text(a, " "))
+
+    # 3) 보조: 키워드 포함 긴 a 텍스트
+    for x in XP_ANCHORS(box):
+        txt = _clean_text(_lxml_text(x, " "))
+        if "여의시스템" in txt and len(txt) > 10:
+            return txt
+    return ""
+
+def _extract_source_from_card_lxml(box, link: str = "") -> str:
+    """_extract_source_from_card 의 lxml XPath 버전"""
+    # 1) 신규/sds 구조 우선
+    # 2) 공용/구형 네이버 구조 (a.info.press 우선, 없으면 info_group 의 첫 a.info)
+    info = XP_INFO_PRESS(box)
+    a_press = next((n for n in info if "press" in (n.get("class") or "").split()), _first(info))
+    for node in (_first(XP_PRESS(box)), a_press):
+        if node is not None:
+            src = _clean_text(_lxml_text(node))
+            if src:
+                return src
+
+    # 3) 클래스 키워드 기반 보조
+    cand = _first(XP_PRESS_CLASS(box))
+    if cand is not None:
+        src = _clean_text(_lxml_text(cand))
+        if src and len(src) <= 30:
+            return src
 
+    # 4) 최후의 보루: 도메인
+    return _source_from_domain(link)
+
+def parse_page_lxml(html: bytes | str):
+    """
+    parse_page 의 lxml XPath 버전 (Lexbor가 카드를 찾지 못한 경우의 1차 폴백).
+    bs4 래퍼 없이 lxml 트리를 XPath 로 직접 탐색합니다.
+    """
+    # <meta charset> 가 없으면 lxml 이 Latin-1 로 해석하므로 UTF-8 로 고정
+    if isinstance(html, str):
+        html = html.encode("utf-8")
+    try:
+        doc = lxml_html.document_fromstring(html, parser=LXML_PARSER)
+    except (etree.ParserError, ValueError):
+        return []
+
+    # 1) 가장 안정적인 구조
+    boxes = XP_CARD(doc)
+    # 2) 없다면 sds 계열 보조
+    if not boxes:
+        boxes = XP_CARD_FALLBACK(doc)
+
+    rows = []
+    for box in boxes:
+        # 제목 (headline 우선)
+        title = _extract_title_from_card_lxml(box)
+        if not title:
+            continue
+
+        # 링크: headline span을 자식으로 가진 a → 공용 a.news_tit → 첫 a
+        a = _first(XP_HEADLINE_ANCHOR(box))
+        if a is None:
+            a = _first(XP_NEWS_TIT(box))
+        if a is None:
+            a = _first(XP_ANCHORS(box))
+        if a is None:
+            continue
+        link = (a.get("href") or "").strip()
+        if not link:
+            continue
+
+        # 언론사 (전용 함수)
+        source = _extract_source_from_card_lxml(box, link)
+
+        # 날짜
         # (a) 안정 구조: info_group > span.info
-        for sp in box.select("div.info_group > span.info"):
-            t = _clean_text(sp.get_text(strip=True))
-            m = DATE_PAT.search(t)
-            if m:
-                date_text = m.group()
-                break
-            rel = _normalize_relative_date(t)
-            if rel:
-                date_text = rel
-                break
+        date_text = _date_from_texts(_lxml_text(sp) for sp in XP_INFO_GROUP(box))
 
         # (b) sds 세 클래스 AND 매칭
         if not date_text:
-            for sp in box.select("span.sds-comps-text.sds-comps-text-type-body2.sds-comps-text-weight-sm"):
-                t = _clean_text(sp.get_text(strip=True))
-                m = DATE_PAT.search(t)
-                if m:
-                    date_text = m.group()
-                    break
-                rel = _normalize_relative_date(t)
-                if rel:
-                    date_text = rel
-                    break
+            date_text = _date_from_texts(_lxml_text(sp) for sp in XP_SDS_DATE(box))
+
+        # (c) time 태그
+        if not date_text:
+            ttag = _first(XP_TIME(box))
+            if ttag is not None:
+                date_text = _date_from_time_tag(ttag.get("datetime"), _lxml_text(ttag))
+
+        # (d) URL 기반 추출 (기사 원문 조회는 crawl 에서 일괄 처리)
+        if not date_text:
+            date_text = _extract_date_from_url(link)
+
+        rows.append({
+            "Title":  title,
+            "Date":   date_text,
+            "Source": source,
+            "Link":   link
+        })
+
+    return rows
+
+def _parse_page_bs4(html: bytes | str):
+    """parse_page 의 BeautifulSoup 폴백 (Lexbor, lxml 모두 카드를 찾지 못한 경우에만 사용)"""
+    soup = BeautifulSoup(html, "lxml")  # lxml 권장
+
+    rows = []
+    # 1) 가장 안정적인 구조
+    boxes = soup.select(CARD_SEL)
+    # 2) 없다면 sds 계열 보조
+    if not boxes:
+        boxes = soup.select(CARD_FALLBACK_SEL)
+
+    for box in boxes:
+        # 제목 (headline 우선)
+        title = _extract_title_from_card_bs4(box)
+        if not title:
+            continue
+
+        # 링크: headline span을 자식으로 가진 a → 공용 a.news_tit → 첫 a
+        a = (
+            _find_headline_anchor_bs4(box)
+            or box.find("a", attrs={"class": NEWS_TIT_RE})
+            or box.find("a")
+        )
+        if not a:
+            continue
+        link = a.get("href", "").strip()
+        if not link:
+            continue
+
+        # info_group 은 언론사/날짜 추출에 함께 쓰이므로 한 번만 조회
+        infos = box.select(INFO_ITEMS_SEL)
+
+        # 언론사 (전용 함수)
+        source = _extract_source_from_card_bs4(box, link, infos)
+
+        # 날짜
+        # (a) 안정 구조: info_group > span.info
+        date_text = _date_from_texts(
+            sp.get_text(strip=True) for sp in infos if sp.name == "span"
+        )
+
+        # (b) sds 세 클래스 AND 매칭
+        if not date_text:
+            date_text = _date_from_texts(
+                sp.get_text(strip=True)
+                for sp in box.select(SDS_DATE_SEL)
+            )
 
         # (c) time 태그
         if not date_text:
             ttag = box.find("time")
             if ttag:
-                dt_attr = ttag.get("datetime")
-                if dt_attr:
-                    try:
-                        dt = datetime.fromisoformat(dt_attr.replace("Z", "+00:00"))
-                        date_text = dt.astimezone(KST).strftime("%Y.%m.%d")
-                    except:
-                        pass
-                if not date_text:
-                    t = _clean_text(ttag.get_text(strip=True))
-                    m = DATE_PAT.search(t)
-                    if m:
-                        date_text = m.group()
-                    else:
-                        rel = _normalize_relative_date(t)
-                        if rel:
-                            date_text = rel
-
-        # (d) URL 기반 추출
-        if not date_text and link:
-            date_text = _extract_date_from_url(link)
+                date_text = _date_from_time_tag(ttag.get("datetime"), ttag.get_text(strip=True))
 
-        # (e) 최후의 보루: 기사 원문
-        if not date_text and link:
-            date_text = _extract_date_from_article(link)
+        # (d) URL 기반 추출 (기사 원문 조회는 crawl 에서 일괄 처리)
+        if not date_text:
+            date_text = _extract_date_from_url(link)
 
         rows.append({
             "Title":  title,
@@ -331,7 +745,155 @@ def parse_page(html: str):
 
     return rows
 
-def crawl(
+def _link_key(link: str) -> int:
+    """
+    중복 판별용 64비트 링크 해시.
+    #fragment 를 떼고 호스트를 소문자로 맞춰 같은 기사의 변형 URL도 한 번만 집계.
+    """
+    parts = urlsplit(link)
+    norm = f"{parts.scheme}://{parts.netloc.lower()}{parts.path}"
+    if parts.query:
+        norm += f"?{parts.query}"
+    if xxhash is not None:
+        return xxhash.xxh64_intdigest(norm.encode())
+    return hash(norm)
+
+def fill_missing_dates(rows) -> None:
+    """
+    최후의 보루: Date 가 빈 행들의 기사 원문을 스레드 풀로 동시에 조회해 날짜를 채움.
+    (rows 를 제자리에서 수정)
+    """
+    needs_date = [r["Link"] for r in rows if not r["Date"] and r["Link"]]
+    if not needs_date:
+        return
+    with ThreadPoolExecutor(max_workers=ARTICLE_WORKERS) as ex:
+        date_map = dict(zip(needs_date, ex.map(_extract_date_from_article, needs_date)))
+    for r in rows:
+        if not r["Date"]:
+            r["Date"] = date_map.get(r["Link"], "")
+
+def _polite_delay(pace: dict, sleep_min: float, sleep_max: float) -> float:
+    """
+    직전 응답 시간에 맞춘 요청 간격(초).
+    pace: {"elapsed": 직전 응답 시간, "backoff": 배수, "next_at": 다음 요청 가능 시각}
+    """
+    elapsed = pace["elapsed"]
+    if elapsed is not None and elapsed < FAST_RESPONSE_SEC:
+        delay = sleep_min * 0.5
+    elif elapsed is not None and elapsed > SLOW_RESPONSE_SEC:
+        delay = sleep_max * 2
+    else:
+        delay = random.uniform(sleep_min, sleep_max)
+    return min(delay * pace["backoff"], MAX_POLITE_DELAY)
+
+def _retry_after(resp, default: float) -> float:
+    """Retry-After(초) 헤더가 있으면 따르고, 없으면 default. 상한 MAX_POLITE_DELAY"""
+    try:
+        wait = float(resp.headers.get("Retry-After", default))
+    except ValueError:  # HTTP-date 형식 등
+        wait = default
+    return min(max(wait, 0.0), MAX_POLITE_DELAY)
+
+async def _fetch_page(client, sem, url: str, pace: dict, sleep_min: float, sleep_max: float, log):
+    """
+    세마포어로 동시 요청 수를 제한하면서 검색 결과 페이지 한 장을 가져옴.
+    (status_code, body) 를 반환하며, 캐시에 있으면 요청/대기 없이 바로 반환
+    (검색 결과 마크업이 있는 200 응답만 캐시함).
+    body 는 디코딩하지 않은 bytes 그대로이며 파서가 직접 처리함.
+    429/503 응답이면 Retry-After 만큼 기다렸다 재시도하고 이후 대기 배수(backoff)를 2배로 늘림.
+    """
+    body = get_response_cache().get(url)
+    if body is not None:
+        log(f"[캐시] {url}")
+        return 200, body
+    loop = asyncio.get_running_loop()
+    async with sem:
+        for attempt in range(MAX_RETRIES + 1):
+            # 예의 있는 대기: 동시 요청 수와 상관없이 요청 시작 간격을 pace["next_at"] 으로 공유해
+            # 전체 요청 속도가 초당 1/대기시간 을 넘지 않도록 함 (순서대로 시작 시각을 예약)
+            now = loop.time()
+            start_at = max(now, pace["next_at"])
+            pace["next_at"] = start_at + _polite_delay(pace, sleep_min, sleep_max)
+            await asyncio.sleep(start_at - now)
+            log(f"[요청] {url}")
+            t0 = time.perf_counter()
+            resp = await client.get(url)
+            pace["elapsed"] = time.perf_counter() - t0
+            if resp.status_code not in RETRY_STATUS or attempt == MAX_RETRIES:
+                break
+            pace["backoff"] = min(pace["backoff"] * 2, MAX_POLITE_DELAY)
+            wait = _retry_after(resp, sleep_max * pace["backoff"])
+            log(f"요청 제한(status={resp.status_code}) → {wait:.1f}초 후 재시도")
+            # 다른 요청들도 최소한 이만큼은 쉬도록 다음 요청 가능 시각을 미룸
+            pace["next_at"] = max(pace["next_at"], loop.time() + wait)
+            await asyncio.sleep(wait)
+    if resp.status_code == 200:
+        # 정상 응답이 이어지면 백오프 배수를 서서히 되돌림
+        pace["backoff"] = max(1.0, pace["backoff"] / 2)
+        # 결과 마크업이 있는 페이지만 캐시 (차단/캡차 페이지가 200 으로 와도 재실행에 남지 않도록)
+        if any(fp in resp.content for fp in RESULT_FINGERPRINTS):
+            get_response_cache().set(url, resp.content, expire=CACHE_EXPIRE)
+    return resp.status_code, resp.content
+
+async def _parse_pages(queue, stop, cpu_pool, results, seen_hashes, log, sink=None):
+    """
+    소비자: 큐에서 (start, body) 를 꺼내 파싱/중복제거 후 results 에 누적 (sink 가 있으면 sink 로 전달).
+    파싱은 cpu_pool 에서 돌리므로 그동안 다음 페이지 다운로드가 계속 진행됨.
+    종료 조건(결과 없음/신규 없음)을 만나면 stop 을 세우고, 생산자가 막히지 않도록
+    종료 신호(None)가 올 때까지 남은 페이지는 버림.
+    """
+    loop = asyncio.get_running_loop()
+    item = ()
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            s, body = item
+
+            if not any(fp in body for fp in RESULT_FINGERPRINTS):
+                log(f"페이지 start={s} 결과 없음 - 조기 종료")
+                break
+
+            rows = await loop.run_in_executor(cpu_pool, parse_page, body)
+
+            # 결과 마크업은 있는데 카드를 못 뽑았다면 구조 변경 가능성 → 디버그용 저장
+            if not rows:
+                with open("debug_naver.html", "wb") as f:
+                    f.write(body)
+                log(f"페이지 start={s} 기사 없음. debug_naver.html 확인")
+                break
+
+            new_rows = []
+            for r in rows:
+                link = r["Link"]
+                if not link:
+                    continue
+                h = _link_key(link)
+                if h in seen_hashes:
+                    continue
+                seen_hashes.add(h)
+                new_rows.append(r)
+
+            await asyncio.to_thread(fill_missing_dates, new_rows)
+            if sink is not None:
+                sink(new_rows)
+            else:
+                results.extend(new_rows)
+            new_cnt = len(new_rows)
+
+            log(f"페이지(start={s}) 수집 {len(rows)}건 / 신규 {new_cnt}건")
+
+            # 신규가 하나도 없으면 조기 종료
+            if new_cnt == 0:
+                log("신규 항목 없음 → 조기 종료")
+                break
+    finally:
+        stop.set()
+        while item is not None:
+            item = await queue.get()
+
+async def crawl_async(
     search_term: str,
     start_date: str,
     end_date: str,
@@ -339,83 +901,195 @@ def crawl(
     max_pages: int,
     sleep_range: tuple[float, float] = (1.0, 2.0),
     log=print,
+    sink=None,
 ):
     """
-    네이버 뉴스 검색 결과를 크롤링하여 (제목, 날짜, 언론사, 링크) 목록을 반환합니다.
-    log 매개변수에 콜러블을 전달해 진행 상황을 스트림릿 등에 출력할 수 있습니다.
+    crawl 의 비동기 구현.
+    다음 PREFETCH_WINDOW 개 페이지(start 오프셋)를 미리 동시에 요청하고(최대 CONCURRENCY 개씩),
+    응답은 start 순서대로 큐에 넣어 별도 파서 태스크(_parse_pages)가 파싱/중복제거합니다.
+    다운로드와 파싱이 겹쳐 진행되면서도 순차 버전과 같은 결과·조기 종료 조건을 유지합니다.
     """
-    titles, dates, sources, links = [], [], [], []
-    seen_links = set()
+    results = []
+    seen_hashes: set[int] = set()
 
     encoded_term = quote_plus(search_term)
     nso_period = f"from{start_date.replace('.', '')}to{end_date.replace('.', '')}"
+    # 검색 조건은 크롤링 내내 같으므로 start 앞부분까지 한 번만 만들어 둠
+    url_prefix = build_url(
+        encoded_term, sort_value, start_date, end_date, nso_period, 0
+    ).rsplit("&start=", 1)[0] + "&start="
     start = 1  # 1, 11, 21 ...
     page_count = 0
     sleep_min, sleep_max = sleep_range
     if sleep_min > sleep_max:
         sleep_min, sleep_max = sleep_max, sleep_min
 
-    while True:
-        page_count += 1
-        if page_count > max_pages:
-            log(f"안전 종료: max_pages({max_pages}) 초과")
-            break
+    sem = asyncio.Semaphore(CONCURRENCY)
+    pace = {"elapsed": None, "backoff": 1.0, "next_at": 0.0}
+    queue = asyncio.Queue(maxsize=PARSE_QUEUE_SIZE)
+    stop = asyncio.Event()
+    transport = httpx.AsyncHTTPTransport(http2=True, retries=2)
+    async with httpx.AsyncClient(
+        transport=transport, headers=headers, timeout=10, follow_redirects=True
+    ) as client:
+        with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as cpu_pool:
+            parser = asyncio.create_task(
+                _parse_pages(queue, stop, cpu_pool, results, seen_hashes, log, sink)
+            )
+            try:
+                while not stop.is_set():
+                    if page_count >= max_pages:
+                        log(f"안전 종료: max_pages({max_pages}) 초과")
+                        break
+
+                    # 다음 페이지들 (네이버는 10단위 페이지네이션: 1, 11, 21, ...)
+                    window = min(PREFETCH_WINDOW, max_pages - page_count)
+                    starts = [start + 10 * i for i in range(window)]
+                    tasks = [
+                        asyncio.create_task(
+                            _fetch_page(
+                                client, sem,
+                                url_prefix + str(s),
+                                pace, sleep_min, sleep_max, log,
+                            )
+                        )
+                        for s in starts
+                    ]
+                    try:
+                        for s, task in zip(starts, tasks):
+                            page_count += 1
+                            try:
+                                status_code, body = await task
+                            except httpx.HTTPError as e:
+                                log(f"요청 예외: {e}")
+                                stop.set()
+                                break
+                            if status_code != 200:
+                                log(f"요청 실패(status={status_code}) start={s}")
+                                stop.set()
+                                break
+
+                            await queue.put((s, body))
+                            if stop.is_set():
+                                break
+                    finally:
+                        # 조기 종료 시 아직 끝나지 않은 선요청은 취소
+                        for task in tasks:
+                            task.cancel()
+                        await asyncio.gather(*tasks, return_exceptions=True)
+
+                    start += 10 * window
+            finally:
+                await queue.put(None)
+                await parser
+
+    return results
 
-        url = build_url(encoded_term, sort_value, start_date, end_date, nso_period, start)
-        log(f"[요청] {url}")
-        try:
-            resp = session.get(url, headers=headers, timeout=10)
-            if resp.status_code != 200:
-                log(f"요청 실패(status={resp.status_code}) start={start}")
-                break
-        except requests.RequestException as e:
-            log(f"요청 예외: {e}")
-            break
+def crawl(
+    search_term: str,
+    start_date: str,
+    end_date: str,
+    sort_value: int,
+    max_pages: int,
+    sleep_range: tuple[float, float] = (1.0, 2.0),
+    log=print,
+    sink=None,
+):
+    """
+    네이버 뉴스 검색 결과를 크롤링하여 {Title, Date, Source, Link} 행(dict) 목록을 반환합니다.
+    log 매개변수에 콜러블을 전달해 진행 상황을 스트림릿 등에 출력할 수 있습니다.
+    sink 를 주면 페이지마다 신규 행 목록으로 sink(rows) 를 호출하고 결과를 쌓아두지 않습니다
+    (이 경우 반환 목록은 비어 있음).
+    (crawl_async 를 동기 방식으로 감싼 래퍼)
+    """
+    return asyncio.run(crawl_async(
+        search_term=search_term,
+        start_date=start_date,
+        end_date=end_date,
+        sort_value=sort_value,
+        max_pages=max_pages,
+        sleep_range=sleep_range,
+        log=log,
+        sink=sink,
+    ))
+
+
+RESULT_COLUMNS = ["Title", "Date", "Source", "Link"]
+PREVIEW_ROWS = 500     # 화면 미리보기로 보여줄 최대 행 수
+
+
+def build_dataframe(rows) -> pd.DataFrame:
+    """crawl 결과 행 목록을 한 번에 DataFrame 으로 변환 (Source: category, Date: datetime)"""
+    df = pd.DataFrame.from_records(rows, columns=RESULT_COLUMNS)
+    df["Source"] = df["Source"].astype("category")
+    dates = df["Date"].astype("string")
+    rel_mask = dates.str.startswith(REL_PREFIX, na=False)
+    parsed = pd.to_datetime(dates.mask(rel_mask), format=DATE_FORMAT, errors="coerce")
+    if rel_mask.any():
+        parsed[rel_mask] = _vec_normalize(dates[rel_mask].str[len(REL_PREFIX):])
+    df["Date"] = parsed
+    return df
+
+
+class RowSink:
+    """
+    crawl 의 sink: 페이지마다 넘어오는 행을 바로 파일(xlsx/csv)에 기록.
+    xlsx 는 xlsxwriter constant_memory 모드로 행 순서대로 흘려 쓰므로 전체 결과를 메모리에 두지 않고,
+    화면 미리보기용으로 앞 PREVIEW_ROWS 행만 보관합니다.
+    target: 파일 경로 또는 BytesIO, fmt: "xlsx" | "csv"
+    """
 
-        rows = parse_page(resp.text)
+    def __init__(self, target, fmt: str = "xlsx"):
+        self.count = 0
+        self.preview = []
+        self._fmt = fmt
+        if fmt == "csv":
+            # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+            if isinstance(target, (str, os.PathLike)):
+                self._fh = open(target, "w", newline="", encoding="utf-8-sig")
+            else:
+                self._fh = TextIOWrapper(target, encoding="utf-8-sig", newline="")
+            self._csv = csv.writer(self._fh)
+            self._csv.writerow(RESULT_COLUMNS)
+        else:
+            self._workbook = xlsxwriter.Workbook(target, {"constant_memory": True})
+            self._ws = self._workbook.add_worksheet()
+            self._date_fmt = self._workbook.add_format({"num_format": "yyyy.mm.dd"})
+            self._ws.write_row(0, 0, RESULT_COLUMNS, self._workbook.add_format({"bold": True}))
 
+    def __call__(self, rows) -> None:
         if not rows:
-            with open("debug_naver.html", "w", encoding="utf-8") as f:
-                f.write(resp.text)
-            log(f"페이지 start={start} 기사 없음. debug_naver.html 확인")
-            break
-
-        new_cnt = 0
-        for r in rows:
-            link = r["Link"]
-            if not link or link in seen_links:
+            return
+        if len(self.preview) < PREVIEW_ROWS:
+            self.preview.extend(rows[:PREVIEW_ROWS - len(self.preview)])
+
+        # 날짜 변환은 페이지 단위로 build_dataframe 에서 한 번에 처리
+        df = build_dataframe(rows)
+        for row in df.itertuples(index=False, name=None):
+            self.count += 1
+            if self._fmt == "csv":
+                self._csv.writerow([
+                    "" if pd.isna(v) else v.strftime(DATE_FORMAT) if isinstance(v, datetime) else v
+                    for v in row
+                ])
                 continue
-            seen_links.add(link)
-            titles.append(r["Title"])
-            dates.append(r["Date"])
-            sources.append(r["Source"])
-            links.append(link)
-            new_cnt += 1
-
-        log(f"페이지(start={start}) 수집 {len(rows)}건 / 신규 {new_cnt}건")
-
-        # 다음 페이지 (네이버는 10단위 페이지네이션: 1, 11, 21, ...)
-        start += 10
-
-        # 예의 있는 대기
-        wait_time = random.uniform(sleep_min, sleep_max)
-        time.sleep(wait_time)
-
-        # 신규가 하나도 없으면 조기 종료
-        if new_cnt == 0:
-            log("신규 항목 없음 → 조기 종료")
-            break
-
-    return titles, dates, sources, links
-
-
-def build_dataframe(titles, dates, sources, links) -> pd.DataFrame:
-    return pd.DataFrame({
-        "Title": titles,
-        "Date": dates,
-        "Source": sources,
-        "Link": links,
-    })
+            for c, value in enumerate(row):
+                if pd.isna(value):
+                    continue
+                if isinstance(value, datetime):
+                    self._ws.write_datetime(self.count, c, value, self._date_fmt)
+                else:
+                    self._ws.write(self.count, c, value)
+
+    def close(self) -> None:
+        if self._fmt != "csv":
+            self._workbook.close()
+        elif isinstance(self._fh, TextIOWrapper):
+            # BytesIO 는 호출 측에서 계속 써야 하므로 닫지 않고 분리만 함
+            self._fh.flush()
+            self._fh.detach()
+        else:
+            self._fh.close()
 
 
 def streamlit_main():
@@ -444,6 +1118,8 @@ def streamlit_main():
         max_pages = st.number_input("최대 페이지 수 (페이지당 10건)", min_value=1, max_value=1000, value=DEFAULT_MAX_PAGES, step=1)
         output_filename = st.text_input("엑셀 파일명", value=DEFAULT_OUTPUT_XLSX)
         save_to_disk = st.checkbox("로컬 파일로 저장", value=True)
+        fast_save = st.checkbox("빠른 저장 (CSV)", value=False)
+        ignore_cache = st.checkbox("캐시 무시", value=False)
         submitted = st.form_submit_button("수집 시작")
 
     if not submitted:
@@ -457,71 +1133,96 @@ def streamlit_main():
     end_date_str = end_date_input.strftime(DATE_FORMAT)
     sort_value = SORT_OPTIONS[sort_label]
 
+    if ignore_cache:
+        get_response_cache().clear()
+
     status_placeholder = st.empty()
-    log_messages = []
+    log_messages = deque(maxlen=10)  # 최근 10줄만 유지
 
     def log_to_streamlit(msg: str):
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_messages.append(f"[{timestamp}] {msg}")
-        status_placeholder.text("\n".join(log_messages[-10:]))
+        status_placeholder.text("\n".join(log_messages))
+
+    output_filename = output_filename or "naver_news_search_results.xlsx"
+    if fast_save:
+        output_filename = output_filename.rsplit(".", 1)[0] + ".csv"
+        fmt, label, mime = "csv", "CSV 다운로드", "text/csv"
+    else:
+        fmt, label, mime = "xlsx", "엑셀 다운로드", (
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
 
+    # 수집하면서 바로 파일 내용을 기록 (다운로드/로컬 저장 모두 이 버퍼를 사용)
+    buffer = BytesIO()
+    sink = RowSink(buffer, fmt)
     with st.spinner("크롤링 중입니다. 잠시만 기다려주세요..."):
         try:
-            titles, dates, sources, links = crawl(
+            crawl(
                 search_term=search_term,
                 start_date=start_date_str,
                 end_date=end_date_str,
                 sort_value=sort_value,
                 max_pages=int(max_pages),
                 log=log_to_streamlit,
+                sink=sink,
             )
         except Exception as exc:  # pragma: no cover - 주로 네트워크 에러 대비
             st.error(f"크롤링 중 오류가 발생했습니다: {exc}")
             return
+        finally:
+            sink.close()
 
-    if not titles:
+    if not sink.count:
         st.warning("수집된 기사가 없습니다.")
         return
 
-    df = build_dataframe(titles, dates, sources, links)
-    st.success(f"총 {len(df)}개의 뉴스 기사를 수집했습니다.")
-    st.dataframe(df, use_container_width=True)
+    st.success(f"총 {sink.count}개의 뉴스 기사를 수집했습니다.")
+    if sink.count > PREVIEW_ROWS:
+        st.caption(f"미리보기는 앞 {PREVIEW_ROWS}건만 표시합니다.")
+    st.dataframe(build_dataframe(sink.preview), use_container_width=True)
 
-    buffer = BytesIO()
-    df.to_excel(buffer, index=False)
     buffer.seek(0)
-    st.download_button(
-        "엑셀 다운로드",
-        buffer,
-        file_name=output_filename or "naver_news_search_results.xlsx",
-        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-    )
+    st.download_button(label, buffer, file_name=output_filename, mime=mime)
 
-    if save_to_disk and output_filename:
+    if save_to_disk:
         try:
-            df.to_excel(output_filename, index=False)
-            st.info(f"엑셀 파일이 저장되었습니다: `{output_filename}`")
+            with open(output_filename, "wb") as f:
+                f.write(buffer.getvalue())
+            st.info(f"파일이 저장되었습니다: `{output_filename}`")
         except Exception as exc:
             st.warning(f"로컬 파일 저장에 실패했습니다: {exc}")
 
 
 def run_cli():
-    titles, dates, sources, links = crawl(
-        search_term=DEFAULT_SEARCH_TERM,
-        start_date=DEFAULT_START_DATE,
-        end_date=DEFAULT_END_DATE,
-        sort_value=DEFAULT_SORT,
-        max_pages=DEFAULT_MAX_PAGES,
-    )
-
-    if not titles:
+    # 임시 파일에 기록하다가 수집이 끝나고 결과가 있을 때만 실제 파일명으로 교체
+    # (결과가 없거나 중간에 실패해도 기존 결과 파일은 그대로 둠)
+    part_path = DEFAULT_OUTPUT_XLSX + ".part"
+    sink = RowSink(part_path)
+    completed = False
+    try:
+        crawl(
+            search_term=DEFAULT_SEARCH_TERM,
+            start_date=DEFAULT_START_DATE,
+            end_date=DEFAULT_END_DATE,
+            sort_value=DEFAULT_SORT,
+            max_pages=DEFAULT_MAX_PAGES,
+            sink=sink,
+        )
+        completed = True
+    finally:
+        sink.close()
+        if completed and sink.count:
+            os.replace(part_path, DEFAULT_OUTPUT_XLSX)
+        elif os.path.exists(part_path):
+            os.remove(part_path)
+
+    if not sink.count:
         print("수집 결과가 없습니다.")
         return
 
-    df = build_dataframe(titles, dates, sources, links)
-    df.to_excel(DEFAULT_OUTPUT_XLSX, index=False)
     print(f"Data saved to {DEFAULT_OUTPUT_XLSX}")
-    print(f"총 {len(df)}개의 뉴스 기사를 수집했습니다.")
+    print(f"총 {sink.count}개의 뉴스 기사를 수집했습니다.")
 
 
 def is_running_with_streamlit() -> bool: